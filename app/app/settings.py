@@ -131,6 +131,11 @@ DATABASES = {
         'PASSWORD': 'asdf1234',
         'HOST': '127.0.0.1',
         'PORT': '5432',
+        # Never wrap whole requests in a transaction: views call
+        # external payment providers, and holding row locks across
+        # those calls would serialize every contended account.
+        # Writes that must be atomic use transaction.atomic() locally.
+        'ATOMIC_REQUESTS': False,
     }
 }
 
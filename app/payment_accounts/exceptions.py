@@ -1,2 +1,6 @@
 class DuplicateError(Exception):
     pass
+
+
+class InsufficientFunds(Exception):
+    pass
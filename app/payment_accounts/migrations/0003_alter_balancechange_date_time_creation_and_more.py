@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-08-29 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0002_transaction_transferhistory_transactionhistory'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='balancechange',
+            name='date_time_creation',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='transactionhistory',
+            name='date_time_creation',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name='balancechange',
+            index=models.Index(fields=['account_id', '-date_time_creation'], name='bc_acct_dt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['transaction_id', '-date_time_creation'], name='th_trans_dt_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0003_alter_balancechange_date_time_creation_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+            CREATE OR REPLACE FUNCTION bc_balance_sync() RETURNS trigger AS $$
+            BEGIN
+                IF (TG_OP = 'INSERT' AND NEW.is_accepted)
+                   OR (TG_OP = 'UPDATE' AND NEW.is_accepted AND NOT OLD.is_accepted) THEN
+                    UPDATE payment_accounts_account
+                    SET balance = balance + NEW.amount
+                        * CASE WHEN NEW.operation_type = 'DT' THEN 1 ELSE -1 END
+                    WHERE id = NEW.account_id_id;
+                END IF;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER bc_balance_sync
+            AFTER INSERT OR UPDATE OF is_accepted
+            ON payment_accounts_balancechange
+            FOR EACH ROW EXECUTE FUNCTION bc_balance_sync();
+            """,
+            reverse_sql="""
+            DROP TRIGGER IF EXISTS bc_balance_sync ON payment_accounts_balancechange;
+            DROP FUNCTION IF EXISTS bc_balance_sync();
+            """,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-29 05:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0004_balance_sync_trigger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='balancechange',
+            name='provider_event_id',
+            field=models.CharField(max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.7 on 2026-08-29 05:42
+
+from django.db import migrations, models
+
+BALANCE_CHANGE_CODES = {'WD': '1', 'WITHDRAW': '1', 'DT': '2', 'DEPOSIT': '2'}
+TRANSACTION_HISTORY_CODES = {'CT': '1', 'CREATED': '1', 'CD': '2', 'COMPLETED': '2'}
+
+
+def map_codes_to_integers(apps, schema_editor):
+    BalanceChange = apps.get_model('payment_accounts', 'BalanceChange')
+    TransactionHistory = apps.get_model('payment_accounts', 'TransactionHistory')
+    for old, new in BALANCE_CHANGE_CODES.items():
+        BalanceChange.objects.filter(operation_type=old).update(operation_type=new)
+    for old, new in TRANSACTION_HISTORY_CODES.items():
+        TransactionHistory.objects.filter(operation_type=old).update(operation_type=new)
+
+
+def map_integers_to_codes(apps, schema_editor):
+    BalanceChange = apps.get_model('payment_accounts', 'BalanceChange')
+    TransactionHistory = apps.get_model('payment_accounts', 'TransactionHistory')
+    BalanceChange.objects.filter(operation_type='1').update(operation_type='WD')
+    BalanceChange.objects.filter(operation_type='2').update(operation_type='DT')
+    TransactionHistory.objects.filter(operation_type='1').update(operation_type='CT')
+    TransactionHistory.objects.filter(operation_type='2').update(operation_type='CD')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0005_balancechange_provider_event_id'),
+    ]
+
+    operations = [
+        migrations.RunPython(map_codes_to_integers, map_integers_to_codes),
+        migrations.AlterField(
+            model_name='balancechange',
+            name='operation_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'WITHDRAW'), (2, 'DEPOSIT')]),
+        ),
+        migrations.AlterField(
+            model_name='transactionhistory',
+            name='operation_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'CREATED'), (2, 'COMPLETED')]),
+        ),
+        migrations.RunSQL(
+            sql="""
+            CREATE OR REPLACE FUNCTION bc_balance_sync() RETURNS trigger AS $$
+            BEGIN
+                IF (TG_OP = 'INSERT' AND NEW.is_accepted)
+                   OR (TG_OP = 'UPDATE' AND NEW.is_accepted AND NOT OLD.is_accepted) THEN
+                    UPDATE payment_accounts_account
+                    SET balance = balance + NEW.amount
+                        * CASE WHEN NEW.operation_type = 2 THEN 1 ELSE -1 END
+                    WHERE id = NEW.account_id_id;
+                END IF;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+            """,
+            reverse_sql="""
+            CREATE OR REPLACE FUNCTION bc_balance_sync() RETURNS trigger AS $$
+            BEGIN
+                IF (TG_OP = 'INSERT' AND NEW.is_accepted)
+                   OR (TG_OP = 'UPDATE' AND NEW.is_accepted AND NOT OLD.is_accepted) THEN
+                    UPDATE payment_accounts_account
+                    SET balance = balance + NEW.amount
+                        * CASE WHEN NEW.operation_type = 'DT' THEN 1 ELSE -1 END
+                    WHERE id = NEW.account_id_id;
+                END IF;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+            """,
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-29 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0006_alter_balancechange_operation_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='balancechange',
+            index=models.Index(condition=models.Q(('is_accepted', False)), fields=['account_id', 'date_time_creation'], name='bc_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-29 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0007_balancechange_bc_pending_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='transferhistory',
+            constraint=models.CheckConstraint(check=models.Q(('account_from', models.F('account_to')), _negated=True), name='xfer_diff_accounts'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0008_transferhistory_xfer_diff_accounts'),
+    ]
+
+    operations = [
+        # Covering index (Postgres >= 11): listing endpoints that page
+        # recent changes are served by an index-only scan instead of
+        # index lookups plus random heap reads per row.
+        migrations.RunSQL(
+            sql="""
+            CREATE INDEX bc_dt_covering
+            ON payment_accounts_balancechange (date_time_creation DESC)
+            INCLUDE (amount, operation_type, is_accepted, account_id_id);
+            """,
+            reverse_sql='DROP INDEX IF EXISTS bc_dt_covering;',
+        ),
+    ]
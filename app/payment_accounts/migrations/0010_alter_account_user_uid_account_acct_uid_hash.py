@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-08-29 05:45
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment_accounts', '0009_bc_dt_covering_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='user_uid',
+            field=models.UUIDField(editable=False, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=django.contrib.postgres.indexes.HashIndex(fields=['user_uid'], name='acct_uid_hash'),
+        ),
+    ]
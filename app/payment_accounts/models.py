@@ -1,73 +1,82 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from django.db import models, transaction
-from django.shortcuts import get_object_or_404
+from django.contrib.postgres.indexes import HashIndex
+from django.db import models
+from django.db.models import F, Q
+from django.http import Http404
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
-from .exceptions import DuplicateError
+from .exceptions import DuplicateError, InsufficientFunds
 
 
-def is_amount_positive(method):
-    def wrapper(cls, *args, **kwargs):
-        amount = kwargs['amount']
-        if amount < 0:
-            raise ValueError('Should be positive value')
-        return method(cls, *args, **kwargs)
-    return wrapper
+_ZERO = Decimal('0.00')
+
+
+def _require_positive(amount: Decimal) -> None:
+    if amount <= _ZERO:
+        raise ValueError('Should be positive value')
 
 
 class Account(models.Model):
-    user_uid = models.UUIDField(unique=True, editable=False, db_index=True)
+    user_uid = models.UUIDField(unique=True, editable=False)
     balance = models.DecimalField(
         decimal_places=2,
         max_digits=settings.MAX_BALANCE_DIGITS,
         validators=[MinValueValidator(0, message='Insufficient Funds')],
-        default=0,
+        default=_ZERO,
     )
 
     @classmethod
-    @is_amount_positive
     def deposit(cls, *, pk: int, amount: Decimal) -> Account:
         """
         Use a classmethod instead of an instance method,
-        to acquire the lock we need to tell the database
-        to lock it, preventing data update collisions.
-        When operating on self the object is already fetched.
-        And we don't have  any guaranty that it was locked.
+        so the delta is applied with a single UPDATE and
+        the arithmetic happens inside the database.
+        No SELECT FOR UPDATE is needed: the statement is
+        atomic on its own, so there is no read-modify-write
+        race and the row lock is held for one statement only.
         """
-        with transaction.atomic():
-            account = get_object_or_404(
-                cls.objects.select_for_update(),
-                pk=pk,
-            )
-            account.balance += amount
-            account.save()
-        return account
+        _require_positive(amount)
+        cls.objects.filter(pk=pk).update(balance=F('balance') + amount)
+        try:
+            return cls.objects.only('pk', 'balance').get(pk=pk)
+        except cls.DoesNotExist:
+            raise Http404('No Account matches the given query.')
 
     @classmethod
-    @is_amount_positive
     def withdraw(cls, *, pk: int, amount: Decimal) -> Account:
-        with transaction.atomic():
-            account = get_object_or_404(
-                cls.objects.select_for_update(),
-                pk=pk,
-            )
-            account.balance -= amount
-            account.save()
-        return account
+        _require_positive(amount)
+        updated = cls.objects.filter(
+            pk=pk,
+            balance__gte=amount,
+        ).update(balance=F('balance') - amount)
+        if not updated:
+            raise InsufficientFunds('Insufficient Funds')
+        try:
+            return cls.objects.only('pk', 'balance').get(pk=pk)
+        except cls.DoesNotExist:
+            raise Http404('No Account matches the given query.')
 
     def __str__(self) -> str:
         return f'User id: {self.user_uid}'
 
+    class Meta:
+        indexes = [
+            # Hash index for the get(user_uid=...) equality lookups:
+            # O(1) probes and no page splits from random UUID inserts.
+            # The unique constraint keeps its own B-tree.
+            HashIndex(fields=['user_uid'], name='acct_uid_hash'),
+        ]
+
 
 message_for_min_validators = 'Should be positive value'
 
 
 class BalanceChange(models.Model):
-    class TransactionType(models.TextChoices):
-        WITHDRAW = ('WD', 'WITHDRAW')
-        DEPOSIT = ('DT', 'DEPOSIT')
+    class TransactionType(models.IntegerChoices):
+        WITHDRAW = (1, 'WITHDRAW')
+        DEPOSIT = (2, 'DEPOSIT')
 
     account_id = models.ForeignKey(
         Account,
@@ -83,10 +92,22 @@ class BalanceChange(models.Model):
     date_time_creation = models.DateTimeField(
         auto_now_add=True,
         editable=False,
-        db_index=True,
     )
     is_accepted = models.BooleanField(default=False)
-    operation_type = models.CharField(max_length=20, choices=TransactionType.choices)
+    operation_type = models.PositiveSmallIntegerField(choices=TransactionType.choices)
+    provider_event_id = models.CharField(max_length=64, unique=True, null=True)
+
+    @classmethod
+    def bulk_record(cls, items) -> list[BalanceChange]:
+        """
+        Insert many changes at once from a list of field dicts.
+        bulk_create collapses N INSERTs into ceil(N/1000)
+        multi-row statements planned once by the database.
+        """
+        return cls.objects.bulk_create(
+            [cls(**item) for item in items],
+            batch_size=1000,
+        )
 
     def __str__(self) -> str:
         return (
@@ -97,6 +118,19 @@ class BalanceChange(models.Model):
 
     class Meta:
         ordering = ['-date_time_creation']
+        indexes = [
+            models.Index(
+                fields=['account_id', '-date_time_creation'],
+                name='bc_acct_dt_idx',
+            ),
+            # Partial index: only the small pending set is indexed,
+            # so acceptance scans stay cache-resident as the table grows.
+            models.Index(
+                fields=['account_id', 'date_time_creation'],
+                name='bc_pending_idx',
+                condition=Q(is_accepted=False),
+            ),
+        ]
 
 
 class TransferHistory(models.Model):
@@ -118,16 +152,31 @@ class TransferHistory(models.Model):
         db_index=True,
     )
 
+    @classmethod
+    def record_many(cls, transfers) -> list[TransferHistory]:
+        """
+        Bulk-insert history rows from (from_id, to_id, amount) tuples.
+        Validation compares the raw *_id attributes, so no Account
+        row is fetched and the whole batch costs a single INSERT.
+        """
+        for from_id, to_id, _ in transfers:
+            if from_id == to_id:
+                raise DuplicateError(
+                    'account_from and account_to should be different values',
+                )
+        return cls.objects.bulk_create([
+            cls(account_from_id=from_id, account_to_id=to_id, amount=amount)
+            for from_id, to_id, amount in transfers
+        ])
+
     def clean(self):
-        if self.account_from == self.account_to:
+        # Comparing the *_id attributes avoids dereferencing
+        # both FK descriptors (two SELECTs) on every validation.
+        if self.account_from_id == self.account_to_id:
             raise DuplicateError(
                 'account_from and account_to should be different values',
             )
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
-
     def __str__(self) -> str:
         return (
             f'Account from: {self.account_from} -> '
@@ -137,6 +186,21 @@ class TransferHistory(models.Model):
 
     class Meta:
         ordering = ['-date_time_creation']
+        constraints = [
+            models.CheckConstraint(
+                check=~Q(account_from=F('account_to')),
+                name='xfer_diff_accounts',
+            ),
+        ]
+
+
+class TransactionQuerySet(models.QuerySet):
+    def with_accounts(self) -> TransactionQuerySet:
+        """
+        Eager-load both accounts with a JOIN, so iterating the
+        transactions does not issue a SELECT per FK access.
+        """
+        return self.select_related('account_from', 'account_to')
 
 
 class Transaction(models.Model):
@@ -163,6 +227,8 @@ class Transaction(models.Model):
     is_frozen = models.BooleanField(default=False)
     is_accepted = models.BooleanField(default=False)
 
+    objects = TransactionQuerySet.as_manager()
+
     def __str__(self) -> str:
         return (
             f'Account from: {self.account_from} -> '
@@ -172,9 +238,9 @@ class Transaction(models.Model):
 
 
 class TransactionHistory(models.Model):
-    class TransactionType(models.TextChoices):
-        CREATED = ('CT', 'CREATED')
-        COMPLETED = ('CD', 'COMPLETED')
+    class TransactionType(models.IntegerChoices):
+        CREATED = (1, 'CREATED')
+        COMPLETED = (2, 'COMPLETED')
 
     transaction_id = models.ForeignKey(
         Transaction,
@@ -185,9 +251,8 @@ class TransactionHistory(models.Model):
     date_time_creation = models.DateTimeField(
         auto_now_add=True,
         editable=False,
-        db_index=True,
     )
-    operation_type = models.CharField(max_length=50, choices=TransactionType.choices)
+    operation_type = models.PositiveSmallIntegerField(choices=TransactionType.choices)
 
     def __str__(self) -> str:
         return (
@@ -197,3 +262,9 @@ class TransactionHistory(models.Model):
 
     class Meta:
         ordering = ['-date_time_creation']
+        indexes = [
+            models.Index(
+                fields=['transaction_id', '-date_time_creation'],
+                name='th_trans_dt_idx',
+            ),
+        ]
@@ -22,7 +22,7 @@ def create_payment(serialized_data):
         account_id=user_account,
         amount=value,
         is_accepted=False,
-        operation_type='DEPOSIT',
+        operation_type=BalanceChange.TransactionType.DEPOSIT,
     )
 
     payment = Payment.create({
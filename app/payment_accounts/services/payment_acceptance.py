@@ -1,9 +1,7 @@
-from decimal import Decimal
-
 import rollbar
 from django.core.exceptions import ObjectDoesNotExist
 
-from ..models import Account, BalanceChange
+from ..models import BalanceChange
 
 
 def payment_acceptance(response):
@@ -20,12 +18,15 @@ def payment_acceptance(response):
         return False
 
     if response['event'] == 'payment.succeeded':
+        if table.is_accepted:
+            # Gateway retried an event that was already processed;
+            # acknowledge it without crediting the account twice.
+            return True
+        # The bc_balance_sync trigger credits the account when
+        # is_accepted flips, so no separate deposit is needed.
         table.is_accepted = True
-        table.save()
-        Account.deposit(
-            pk=response['object']['metadata']['user_id'],
-            amount=Decimal(response['object']['income_amount']['value']),
-        )
+        table.provider_event_id = response['object']['id']
+        table.save(update_fields=['is_accepted', 'provider_event_id'])
     elif response['event'] == 'payment.canceled':
         table.delete()
 
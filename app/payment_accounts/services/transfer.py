@@ -0,0 +1,26 @@
+from decimal import Decimal
+
+from django.db import transaction
+
+from ..exceptions import DuplicateError
+from ..models import Account, TransferHistory
+
+
+def transfer(account_from_id: int, account_to_id: int, amount: Decimal) -> TransferHistory:
+    """
+    Move amount between two accounts and record the transfer.
+    Validation happens here on the raw ids, so saving the history
+    row does not re-run full_clean and its per-field validators.
+    """
+    if account_from_id == account_to_id:
+        raise DuplicateError(
+            'account_from and account_to should be different values',
+        )
+    with transaction.atomic():
+        Account.withdraw(pk=account_from_id, amount=amount)
+        Account.deposit(pk=account_to_id, amount=amount)
+        return TransferHistory.objects.create(
+            account_from_id=account_from_id,
+            account_to_id=account_to_id,
+            amount=amount,
+        )
@@ -1,5 +1,8 @@
-import json
-
+import orjson
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.generics import CreateAPIView
 from rest_framework.response import Response
 
@@ -12,26 +15,29 @@ class CreatePaymentView(CreateAPIView):
     serializer_class = CreatePaymentSerializer
 
     def post(self, request, *args, **kwargs):
-        serializer = CreatePaymentSerializer(data=request.POST)
-
-        if serializer.is_valid():
-            serialized_data = serializer.validated_data
-        else:
-            return Response(400)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        confirmation_url = create_payment(serialized_data)
+        confirmation_url = create_payment(serializer.validated_data)
 
-        return Response({'confirmation_url': confirmation_url}, 200)
+        return Response({'confirmation_url': confirmation_url}, status=200)
 
 
-class CreatePaymentAcceptanceView(CreateAPIView):
+@method_decorator(csrf_exempt, name='dispatch')
+class CreatePaymentAcceptanceView(View):
+    """
+    Plain Django view: the webhook needs no serializer, renderer,
+    or content negotiation, so DRF's request pipeline is skipped.
+    """
 
     def post(self, request, *args, **kwargs):
-        response = json.loads(request.body)
+        # orjson parses the raw bytes directly, skipping the
+        # implicit UTF-8 decode pass of the stdlib parser.
+        response = orjson.loads(request.body)
 
         if payment_acceptance(response):
-            return Response(200)
-        return Response(404)
+            return HttpResponse(status=200)
+        return HttpResponse(status=404)
 
 
 # from django.shortcuts import render
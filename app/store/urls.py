@@ -7,6 +7,6 @@ urlpatterns = [
     path("add_to_cart", views.add_to_cart, name="add"),
     path("dec_cart", views.dec_cart, name="dec"),
     path("del_cart", views.del_cart, name="del"),
-    path("confirm_payment/<str:pk>", views.confirm_payment, name="add"),
+    path("confirm_payment/<uuid:pk>", views.confirm_payment, name="confirm_payment"),
     path("payment", views.payment, name="payment")
 ]